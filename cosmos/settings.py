@@ -13,6 +13,7 @@ from cosmos.constants import (
     DEFAULT_COSMOS_CACHE_DIR_NAME,
     DEFAULT_OPENLINEAGE_NAMESPACE,
 )
+from cosmos.exceptions import CosmosValueError
 
 # In MacOS users may want to set the envvar `TMPDIR` if they do not want the value of the temp directory to change
 DEFAULT_CACHE_DIR = Path(tempfile.gettempdir(), DEFAULT_COSMOS_CACHE_DIR_NAME)
@@ -39,6 +40,11 @@ remote_cache_dir = conf.get("cosmos", "remote_cache_dir", fallback=None)
 remote_cache_dir_conn_id = conf.get("cosmos", "remote_cache_dir_conn_id", fallback=None)
 remote_target_path = conf.get("cosmos", "remote_target_path", fallback=None)
 remote_target_path_conn_id = conf.get("cosmos", "remote_target_path_conn_id", fallback=None)
+upload_concurrency = conf.getint("cosmos", "upload_concurrency", fallback=16)
+if upload_concurrency < 1:
+    raise CosmosValueError(
+        f"The upload_concurrency setting must be greater than or equal to 1, got {upload_concurrency}."
+    )
 
 # Eager imports in cosmos/__init__.py expose all Cosmos classes at the top level,
 # which can significantly increase memory usage—even when Cosmos is installed but not actively used.
@@ -30,7 +30,7 @@ from cosmos.dbt.parser.output import (
 )
 from cosmos.exceptions import CosmosDbtRunError, CosmosValueError
 from cosmos.hooks.subprocess import FullOutputSubprocessResult
-from cosmos.io import _construct_dest_file_path
+from cosmos.io import _make_dest_builder
 from cosmos.operators.local import (
     AbstractDbtLocalBase,
     DbtBuildLocalOperator,
@@ -1753,9 +1753,12 @@ def test_handle_post_execution_with_multiple_callbacks(
         callback_fn.assert_called_once_with("/tmp/project_dir", arg1="value1", context=context)
 
 
-def test_construct_dest_file_path_with_run_id():
-    """Test _construct_dest_file_path uses run_id correctly."""
-    dest_target_dir = Path("/dest")
+@pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
+def test_make_dest_builder_with_run_id():
+    """Test _make_dest_builder uses run_id correctly."""
+    from airflow.io.path import ObjectStoragePath
+
+    dest_target_dir = ObjectStoragePath("file:///dest", conn_id="fs_local")
     source_target_dir = Path("/project_dir/target")
     file_path = "/project_dir/target/subdir/file.txt"
     source_subpath = "target"
@@ -1766,7 +1769,7 @@ def test_construct_dest_file_path_with_run_id():
         "run_id": "test_run_id",
         "task_instance": MagicMock(task_id="test_task", try_number=1),
     }
-    result = _construct_dest_file_path(dest_target_dir, file_path, source_target_dir, source_subpath, context=context)
+    result = _make_dest_builder(dest_target_dir, source_target_dir, source_subpath, context)(file_path)
 
     assert result == expected_path
     assert "test_run_id" in result
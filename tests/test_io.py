@@ -1,13 +1,30 @@
+import math
+import tarfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.config import Config
+from requests.adapters import HTTPAdapter
 
 from cosmos.constants import DEFAULT_TARGET_PATH, _default_s3_conn
 from cosmos.exceptions import CosmosValueError
 from cosmos.io import (
+    _bundled_directory,
+    _cached_show_array,
     _configure_remote_target_path,
-    _construct_dest_file_path,
+    _existing_remote_target_paths,
+    _extract_show_list,
+    _extract_show_list_from_file,
+    _find_show_array_in_file,
+    _get_gcs_hook,
+    _get_s3_hook,
+    _get_task_run_identifier,
+    _get_wasb_hook,
+    _iter_files,
+    _make_dest_builder,
+    _run_concurrently,
+    log_to_xcom,
     upload_to_aws_s3,
     upload_to_azure_wasb,
     upload_to_cloud_storage,
@@ -16,6 +33,23 @@ from cosmos.io import (
 from cosmos.settings import AIRFLOW_IO_AVAILABLE
 
 
+@pytest.fixture(autouse=True)
+def clear_hook_cache():
+    """Fixture to make sure each test builds its own (mocked) hooks."""
+    yield
+    _get_s3_hook.cache_clear()
+    _get_gcs_hook.cache_clear()
+    _get_wasb_hook.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_existing_remote_target_paths():
+    """Fixture to make sure each test checks the existence of its remote target path."""
+    _existing_remote_target_paths.clear()
+    yield
+    _existing_remote_target_paths.clear()
+
+
 @pytest.fixture
 def dummy_kwargs():
     """Fixture for reusable test kwargs."""
@@ -30,40 +64,388 @@ def dummy_kwargs():
     }
 
 
-def test_upload_artifacts_to_aws_s3(dummy_kwargs):
+def test_run_concurrently_calls_func_for_each_item():
+    """Test _run_concurrently calls the function once per item."""
+    func = MagicMock()
+
+    _run_concurrently(func, [("a", 1), ("b", 2)])
+
+    assert func.call_count == 2
+    func.assert_any_call("a", 1)
+    func.assert_any_call("b", 2)
+
+
+@patch("cosmos.io.settings.upload_concurrency", 1)
+def test_run_concurrently_raises_error():
+    """Test _run_concurrently surfaces exceptions raised by the function."""
+    func = MagicMock(side_effect=[OSError("upload failed"), None, None])
+
+    with pytest.raises(OSError, match="upload failed"):
+        _run_concurrently(func, [("a",), ("b",), ("c",)])
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Fixture for a project directory containing dbt artifacts in its target directory."""
+    (tmp_path / "target" / "subdir").mkdir(parents=True)
+    (tmp_path / "target" / "file1.txt").write_text("file1")
+    (tmp_path / "target" / "subdir" / "file2.txt").write_text("file2")
+    return tmp_path
+
+
+def test_iter_files(project_dir):
+    """Test _iter_files yields the files within the directory and its sub-directories."""
+    (project_dir / "target" / "subdir" / "nested").mkdir()
+    (project_dir / "target" / "subdir" / "nested" / "file3.txt").write_text("file3")
+
+    paths = sorted(entry.path for entry in _iter_files(str(project_dir / "target")))
+
+    assert paths == [
+        str(project_dir / "target" / "file1.txt"),
+        str(project_dir / "target" / "subdir" / "file2.txt"),
+        str(project_dir / "target" / "subdir" / "nested" / "file3.txt"),
+    ]
+
+
+def test_iter_files_missing_directory(tmp_path):
+    """Test _iter_files yields nothing when the directory does not exist, like os.walk."""
+    assert list(_iter_files(str(tmp_path / "target"))) == []
+
+
+def test_get_s3_hook_is_cached_per_connection():
+    """Test the S3 hook is only built once for each connection ID."""
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook:
+        mock_hook.return_value.config = None
+        assert _get_s3_hook("aws_conn") is _get_s3_hook("aws_conn")
+        _get_s3_hook("other_aws_conn")
+
+    assert mock_hook.call_count == 2
+    mock_hook.assert_any_call(aws_conn_id="aws_conn")
+
+
+@patch("cosmos.io.settings.upload_concurrency", 32)
+def test_get_s3_hook_connection_pool_size():
+    """Test the S3 hook connection pool is sized to the upload concurrency, unless the connection configures it."""
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook:
+        mock_hook.return_value.config = None
+        hook = _get_s3_hook("aws_conn")
+        assert hook.conn_config.botocore_config.max_pool_connections == 32
+
+        mock_hook.return_value.config = Config(max_pool_connections=8, region_name="us-east-1")
+        hook = _get_s3_hook("other_aws_conn")
+        config = hook.conn_config.botocore_config
+        assert config.max_pool_connections == 8
+        assert config.region_name == "us-east-1"
+
+
+@patch("cosmos.io.settings.upload_concurrency", 32)
+def test_get_gcs_hook_connection_pool_size():
+    """Test the GCS client connection pool is resized to the upload concurrency, keeping the mounted adapter."""
+    adapter = HTTPAdapter()
+    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook") as mock_hook:
+        session = mock_hook.return_value.get_conn.return_value._http
+        session.get_adapter.return_value = adapter
+        _get_gcs_hook("gcp_conn")
+
+    session.get_adapter.assert_called_once_with("https://")
+    session.mount.assert_not_called()
+    assert adapter._pool_maxsize == 32
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+@patch("cosmos.io.load_method_from_module", side_effect=ModuleNotFoundError)
+def test_get_wasb_hook_without_provider(mock_load_method_from_module):
+    """Test a missing provider raises a CosmosValueError pointing to the optional dependency."""
+    with pytest.raises(CosmosValueError, match=r"astronomer-cosmos\[...,microsoft\]"):
+        _get_wasb_hook(None)
+
+
+def test_upload_artifacts_to_aws_s3(dummy_kwargs, project_dir):
     """Test upload_artifacts_to_aws_s3."""
-    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook, patch("os.walk") as mock_walk:
-        mock_walk.return_value = [("/target", [], ["file1.txt", "file2.txt"])]
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook, patch(
+        "boto3.s3.transfer.create_transfer_manager"
+    ) as mock_create_transfer_manager:
+        mock_hook.return_value.extra_args = {}
+
+        upload_to_aws_s3(str(project_dir), **dummy_kwargs)
+
+        assert mock_create_transfer_manager.call_args.args[0] == mock_hook.return_value.get_conn.return_value
+        mock_transfer_manager = mock_create_transfer_manager.return_value.__enter__.return_value
+        assert mock_transfer_manager.upload.call_count == 2
+        mock_transfer_manager.upload.assert_any_call(
+            str(project_dir / "target" / "subdir" / "file2.txt"),
+            "test_bucket",
+            "test_dag/test_run_id/test_task/1/target/subdir/file2.txt",
+            extra_args={},
+        )
+        mock_transfer_manager.upload.return_value.result.assert_called()
+
+
+@patch("airflow.providers.common.compat.lineage.hook.get_hook_lineage_collector")
+def test_upload_artifacts_to_aws_s3_reports_lineage(mock_get_collector, dummy_kwargs, project_dir):
+    """Test upload_artifacts_to_aws_s3 reports the uploaded files as hook lineage, like S3Hook.load_file."""
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook, patch(
+        "boto3.s3.transfer.create_transfer_manager"
+    ):
+        upload_to_aws_s3(str(project_dir), **dummy_kwargs)
+
+    collector = mock_get_collector.return_value
+    assert collector.add_input_asset.call_count == 2
+    collector.add_input_asset.assert_any_call(
+        context=mock_hook.return_value,
+        scheme="file",
+        asset_kwargs={"path": str(project_dir / "target" / "subdir" / "file2.txt")},
+    )
+    collector.add_output_asset.assert_any_call(
+        context=mock_hook.return_value,
+        scheme="s3",
+        asset_kwargs={"bucket": "test_bucket", "key": "test_dag/test_run_id/test_task/1/target/subdir/file2.txt"},
+    )
 
-        upload_to_aws_s3("/project_dir", **dummy_kwargs)
 
-        mock_walk.assert_called_once_with("/project_dir/target")
-        hook_instance = mock_hook.return_value
-        assert hook_instance.load_file.call_count == 2
+def test_upload_artifacts_to_aws_s3_missing_target(dummy_kwargs, tmp_path):
+    """Test upload_artifacts_to_aws_s3 uploads nothing when the target directory does not exist."""
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook, patch(
+        "boto3.s3.transfer.create_transfer_manager"
+    ) as mock_create_transfer_manager:
+        mock_hook.return_value.extra_args = {}
+
+        upload_to_aws_s3(str(tmp_path), **dummy_kwargs)
+
+        mock_create_transfer_manager.return_value.__enter__.return_value.upload.assert_not_called()
+
+
+def test_upload_artifacts_to_aws_s3_without_transfer_manager(dummy_kwargs, project_dir, monkeypatch):
+    """Test upload_artifacts_to_aws_s3 uploads the files with the hook when boto3 has no create_transfer_manager."""
+    monkeypatch.delattr("boto3.s3.transfer.create_transfer_manager")
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook:
+        upload_to_aws_s3(str(project_dir), **dummy_kwargs)
+
+        assert mock_hook.return_value.load_file.call_count == 2
+        mock_hook.return_value.load_file.assert_any_call(
+            filename=str(project_dir / "target" / "subdir" / "file2.txt"),
+            bucket_name="test_bucket",
+            key="test_dag/test_run_id/test_task/1/target/subdir/file2.txt",
+            replace=True,
+        )
+
+
+def test_bundled_directory(project_dir):
+    """Test _bundled_directory archives the directory in a temporary tarball."""
+    with _bundled_directory(str(project_dir / "target"), "target") as bundle_path:
+        assert bundle_path.endswith("target.tar.gz")
+        with tarfile.open(bundle_path) as tar:
+            assert {"target/file1.txt", "target/subdir/file2.txt"} <= set(tar.getnames())
+
+    assert not Path(bundle_path).exists()
+
+
+def test_upload_artifacts_to_aws_s3_bundle(dummy_kwargs, project_dir):
+    """Test upload_artifacts_to_aws_s3 uploads a single archive when bundle is enabled."""
+    with patch("airflow.providers.amazon.aws.hooks.s3.S3Hook") as mock_hook, patch(
+        "boto3.s3.transfer.create_transfer_manager"
+    ) as mock_create_transfer_manager:
+        mock_hook.return_value.extra_args = {}
 
+        upload_to_aws_s3(str(project_dir), bundle=True, **dummy_kwargs)
 
-def test_upload_artifacts_to_gcp_gs(dummy_kwargs):
+        mock_transfer_manager = mock_create_transfer_manager.return_value.__enter__.return_value
+        mock_transfer_manager.upload.assert_called_once()
+        file_path, bucket_name, s3_key = mock_transfer_manager.upload.call_args.args
+        assert file_path.endswith("target.tar.gz")
+        assert bucket_name == "test_bucket"
+        assert s3_key == "test_dag/test_run_id/test_task/1/target.tar.gz"
+
+
+def test_upload_artifacts_to_gcp_gs(dummy_kwargs, project_dir):
     """Test upload_artifacts_to_gcp_gs."""
-    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook") as mock_hook, patch("os.walk") as mock_walk:
-        mock_walk.return_value = [("/target", [], ["file1.txt", "file2.txt"])]
+    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook") as mock_hook, patch(
+        "google.cloud.storage.transfer_manager.upload_many"
+    ) as mock_upload_many:
+        upload_to_gcp_gs(str(project_dir), **dummy_kwargs)
+
+        mock_bucket = mock_hook.return_value.get_conn.return_value.bucket
+        mock_bucket.assert_called_once_with("test_bucket")
+        mock_upload_many.assert_called_once()
+        assert len(mock_upload_many.call_args.args[0]) == 2
+        mock_bucket.return_value.blob.assert_any_call(f"{project_dir.name}/target/subdir/file2.txt")
+
+
+@patch("airflow.providers.common.compat.lineage.hook.get_hook_lineage_collector")
+def test_upload_artifacts_to_gcp_gs_reports_lineage(mock_get_collector, dummy_kwargs, project_dir):
+    """Test upload_artifacts_to_gcp_gs reports the uploaded files as hook lineage, like GCSHook.upload."""
+    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook") as mock_hook, patch(
+        "google.cloud.storage.transfer_manager.upload_many"
+    ):
+        upload_to_gcp_gs(str(project_dir), **dummy_kwargs)
+
+    collector = mock_get_collector.return_value
+    assert collector.add_output_asset.call_count == 2
+    collector.add_output_asset.assert_any_call(
+        context=mock_hook.return_value,
+        scheme="gs",
+        asset_kwargs={"bucket": "test_bucket", "key": f"{project_dir.name}/target/subdir/file2.txt"},
+    )
 
-        upload_to_gcp_gs("/project_dir", **dummy_kwargs)
 
-        mock_walk.assert_called_once_with("/project_dir/target")
-        hook_instance = mock_hook.return_value
-        assert hook_instance.upload.call_count == 2
+def test_upload_artifacts_to_gcp_gs_missing_target(dummy_kwargs, tmp_path):
+    """Test upload_artifacts_to_gcp_gs uploads nothing when the target directory does not exist."""
+    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook"), patch(
+        "google.cloud.storage.transfer_manager.upload_many"
+    ) as mock_upload_many:
+        upload_to_gcp_gs(str(tmp_path), **dummy_kwargs)
 
+        assert mock_upload_many.call_args.args[0] == []
 
-def test_upload_artifacts_to_azure_wasb(dummy_kwargs):
-    """Test upload_artifacts_to_azure_wasb."""
-    with patch("airflow.providers.microsoft.azure.hooks.wasb.WasbHook") as mock_hook, patch("os.walk") as mock_walk:
-        mock_walk.return_value = [("/target", [], ["file1.txt", "file2.txt"])]
 
-        upload_to_azure_wasb("/project_dir", **dummy_kwargs)
+def test_upload_artifacts_to_gcp_gs_without_thread_workers(dummy_kwargs, project_dir, monkeypatch):
+    """Test upload_artifacts_to_gcp_gs uploads the files with the hook when transfer_manager has no thread workers."""
+    monkeypatch.delattr("google.cloud.storage.transfer_manager.THREAD")
+    with patch("airflow.providers.google.cloud.hooks.gcs.GCSHook") as mock_hook, patch(
+        "google.cloud.storage.transfer_manager.upload_many"
+    ) as mock_upload_many:
+        upload_to_gcp_gs(str(project_dir), **dummy_kwargs)
+
+        mock_upload_many.assert_not_called()
+        assert mock_hook.return_value.upload.call_count == 2
+        mock_hook.return_value.upload.assert_any_call(
+            bucket_name="test_bucket",
+            object_name=f"{project_dir.name}/target/subdir/file2.txt",
+            filename=str(project_dir / "target" / "subdir" / "file2.txt"),
+        )
+
+
+def test_upload_artifacts_to_azure_wasb(dummy_kwargs, project_dir):
+    """Test upload_artifacts_to_azure_wasb."""
+    with patch("airflow.providers.microsoft.azure.hooks.wasb.WasbHook") as mock_hook:
+        upload_to_azure_wasb(str(project_dir), **dummy_kwargs)
 
-        mock_walk.assert_called_once_with("/project_dir/target")
         hook_instance = mock_hook.return_value
         assert hook_instance.load_file.call_count == 2
+        hook_instance.load_file.assert_any_call(
+            file_path=str(project_dir / "target" / "subdir" / "file2.txt"),
+            container_name="test_container",
+            blob_name="test_dag/test_run_id/test_task/1/target/subdir/file2.txt",
+            overwrite=True,
+        )
+
+
+def test_upload_artifacts_to_azure_wasb_missing_target(dummy_kwargs, tmp_path):
+    """Test upload_artifacts_to_azure_wasb uploads nothing when the target directory does not exist."""
+    with patch("airflow.providers.microsoft.azure.hooks.wasb.WasbHook") as mock_hook:
+        upload_to_azure_wasb(str(tmp_path), **dummy_kwargs)
+
+        mock_hook.return_value.load_file.assert_not_called()
+
+
+def test_extract_show_list():
+    """Test _extract_show_list returns the JSON array following the "show" key."""
+    log_string = 'Running with dbt\n{"show": [{"id": 1, "name": "a"},\n {"id": 2, "name": "b"}]}\nDone.'
+
+    assert _extract_show_list(log_string) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+
+def test_extract_show_list_json_extensions():
+    """Test _extract_show_list keeps the standard library json semantics for non-finite numbers and large integers."""
+    log_string = '{"show": [{"id": 123456789012345678901234567890, "value": NaN, "max": Infinity}]}'
+
+    (row,) = _extract_show_list(log_string)
+
+    assert row["id"] == 123456789012345678901234567890
+    assert math.isnan(row["value"])
+    assert row["max"] == math.inf
+
+
+def test_extract_show_list_not_found():
+    """Test _extract_show_list raises an error if there is no "show" array in the log string."""
+    with pytest.raises(ValueError, match="Could not find 'show' JSON array in string."):
+        _extract_show_list("Running with dbt\nDone.")
+
+
+def test_extract_show_list_invalid_json():
+    """Test _extract_show_list raises an error if the "show" array is not valid JSON."""
+    with pytest.raises(ValueError, match="JSON decoding failed"):
+        _extract_show_list('{"show": [{"id": 1,}]}')
+
+
+def test_extract_show_list_from_file(tmp_path):
+    """Test _extract_show_list_from_file reads the "show" array from a log file."""
+    log_path = tmp_path / "dbt.log"
+    log_path.write_text('Running with dbt\n{"show": [{"id": 1}]}\nDone.\n', encoding="utf-8")
+
+    assert _extract_show_list_from_file(log_path) == [{"id": 1}]
+
+
+@patch("cosmos.io._LOG_FILE_MADVICE", ())
+def test_extract_show_list_from_file_without_madvise(tmp_path):
+    """Test _extract_show_list_from_file on platforms where the memory-map advice is not available."""
+    log_path = tmp_path / "dbt.log"
+    log_path.write_text('{"show": [{"id": 1}]}\n', encoding="utf-8")
+
+    assert _extract_show_list_from_file(log_path) == [{"id": 1}]
+
+
+def test_extract_show_list_from_empty_file(tmp_path):
+    """Test _extract_show_list_from_file raises an error if the log file is empty."""
+    log_path = tmp_path / "dbt.log"
+    log_path.touch()
+
+    with pytest.raises(ValueError, match="Could not find 'show' JSON array in string."):
+        _extract_show_list_from_file(log_path)
+
+
+@patch("airflow.operators.python.get_current_context")
+def test_log_to_xcom(mock_get_current_context, tmp_path):
+    """Test log_to_xcom pushes the "show" array of the dbt log file to XCom."""
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "dbt.log").write_text('{"show": [{"id": 1}]}', encoding="utf-8")
+
+    log_to_xcom(str(tmp_path), xcom_key="custom_key")
+
+    mock_ti = mock_get_current_context.return_value["ti"]
+    mock_ti.xcom_push.assert_called_once_with(key="custom_key", value=[{"id": 1}])
+
+
+@patch("airflow.operators.python.get_current_context")
+def test_log_to_xcom_caches_parsed_log(mock_get_current_context, tmp_path):
+    """Test log_to_xcom only scans the dbt log file again if it changed."""
+    log_path = tmp_path / "logs" / "dbt.log"
+    log_path.parent.mkdir()
+    log_path.write_text('{"show": [{"id": 1}]}', encoding="utf-8")
+    mock_ti = mock_get_current_context.return_value["ti"]
+    _cached_show_array.cache_clear()
+
+    with patch("cosmos.io._find_show_array_in_file", wraps=_find_show_array_in_file) as mock_find:
+        log_to_xcom(str(tmp_path))
+        log_to_xcom(str(tmp_path))
+        assert mock_find.call_count == 1
+
+        log_path.write_text('{"show": [{"id": 1}, {"id": 2}]}', encoding="utf-8")
+        log_to_xcom(str(tmp_path))
+        assert mock_find.call_count == 2
+
+    mock_ti.xcom_push.assert_called_with(key="dbt_logs", value=[{"id": 1}, {"id": 2}])
+
+
+@patch("airflow.operators.python.get_current_context")
+def test_log_to_xcom_does_not_share_cached_items(mock_get_current_context, tmp_path):
+    """Test the values pushed by log_to_xcom can be modified without changing the cached "show" array."""
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "dbt.log").write_text('{"show": [{"id": 1}]}', encoding="utf-8")
+    mock_ti = mock_get_current_context.return_value["ti"]
+    _cached_show_array.cache_clear()
+
+    log_to_xcom(str(tmp_path))
+    mock_ti.xcom_push.call_args.kwargs["value"][0]["id"] = 2
+    log_to_xcom(str(tmp_path))
+
+    mock_ti.xcom_push.assert_called_with(key="dbt_logs", value=[{"id": 1}])
+
+
+def test_log_to_xcom_file_not_found(tmp_path):
+    """Test log_to_xcom raises an error if the log file does not exist."""
+    with pytest.raises(ValueError, match="Log file not found"):
+        log_to_xcom(str(tmp_path))
 
 
 @patch("cosmos.io.settings.remote_target_path", None)
@@ -75,16 +457,37 @@ def test_configure_remote_target_path_no_remote_target():
     assert _configure_remote_target_path() == (None, None)
 
 
-def test_construct_dest_file_path(dummy_kwargs):
-    """Test _construct_dest_file_path."""
-    dest_target_dir = Path("/dest")
-    source_target_dir = Path("/project_dir/target")
-    file_path = "/project_dir/target/subdir/file.txt"
+def test_get_task_run_identifier(dummy_kwargs):
+    """Test _get_task_run_identifier."""
+    assert _get_task_run_identifier(dummy_kwargs["context"]) == "test_dag/test_run_id/test_task/1"
+
+
+def test_get_task_run_identifier_airflow2_try_number(dummy_kwargs):
+    """Test _get_task_run_identifier falls back to the Airflow 2 private try number attribute."""
+    dummy_kwargs["context"]["task_instance"] = MagicMock(task_id="test_task", try_number=None, _try_number=2)
 
-    expected_path = "/dest/test_dag/test_run_id/test_task/1/target/subdir/file.txt"
+    assert _get_task_run_identifier(dummy_kwargs["context"]) == "test_dag/test_run_id/test_task/2"
+
+
+@pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
+def test_make_dest_builder(dummy_kwargs):
+    """Test _make_dest_builder builds file system paths, without the connection ID of the remote target path."""
+    from airflow.io.path import ObjectStoragePath
+
+    build_dest_file_path = _make_dest_builder(
+        ObjectStoragePath("s3://bucket/dest/", conn_id="aws_default"),
+        Path("/project_dir/target"),
+        DEFAULT_TARGET_PATH,
+        dummy_kwargs["context"],
+    )
+
+    assert (
+        build_dest_file_path("/project_dir/target/file.txt")
+        == "bucket/dest/test_dag/test_run_id/test_task/1/target/file.txt"
+    )
     assert (
-        _construct_dest_file_path(dest_target_dir, file_path, source_target_dir, DEFAULT_TARGET_PATH, **dummy_kwargs)
-        == expected_path
+        build_dest_file_path("/project_dir/target/subdir/file.txt")
+        == "bucket/dest/test_dag/test_run_id/test_task/1/target/subdir/file.txt"
     )
 
 
@@ -95,29 +498,58 @@ def test_upload_artifacts_to_cloud_storage_no_remote_path():
             upload_to_cloud_storage("/project_dir", **{})
 
 
+@pytest.fixture
+def s3_remote_target_dir(monkeypatch):
+    """Fixture for an S3 remote target path created with a connection ID, whose uploads are not sent."""
+    from airflow.io.path import ObjectStoragePath
+
+    monkeypatch.setenv("AIRFLOW_CONN_AWS_DEFAULT", "aws://")
+    dest_target_dir = ObjectStoragePath("s3://bucket/dest", conn_id="aws_default")
+    with patch("cosmos.io._configure_remote_target_path", return_value=(dest_target_dir, "aws_default")), patch.object(
+        dest_target_dir.fs, "_put_file", new_callable=AsyncMock
+    ):
+        yield dest_target_dir
+
+
 @pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
-def test_upload_artifacts_to_cloud_storage_success(dummy_kwargs):
-    """Test upload_artifacts_to_cloud_storage with valid setup."""
-    with patch(
-        "cosmos.io._configure_remote_target_path",
-        return_value=(Path("/dest"), "conn_id"),
-    ) as mock_configure, patch("pathlib.Path.rglob") as mock_rglob, patch(
-        "airflow.io.path.ObjectStoragePath.copy"
-    ) as mock_copy:
-        mock_file1 = MagicMock(spec=Path)
-        mock_file1.is_file.return_value = True
-        mock_file1.__str__.return_value = "/project_dir/target/file1.txt"
+def test_upload_artifacts_to_cloud_storage_success(dummy_kwargs, project_dir, s3_remote_target_dir):
+    """Test upload_artifacts_to_cloud_storage uploads the files within the bucket, without the connection ID."""
+    upload_to_cloud_storage(str(project_dir), **dummy_kwargs)
+
+    mock_put_file = s3_remote_target_dir.fs._put_file
+    assert mock_put_file.await_count == 2
+    dest_prefix = "bucket/dest/test_dag/test_run_id/test_task/1/target"
+    assert {call.args[:2] for call in mock_put_file.await_args_list} == {
+        (str(project_dir / "target" / "file1.txt"), f"{dest_prefix}/file1.txt"),
+        (str(project_dir / "target" / "subdir" / "file2.txt"), f"{dest_prefix}/subdir/file2.txt"),
+    }
+
+
+@pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
+def test_upload_artifacts_to_cloud_storage_missing_target(dummy_kwargs, tmp_path, s3_remote_target_dir):
+    """Test upload_artifacts_to_cloud_storage uploads nothing when the target directory does not exist."""
+    upload_to_cloud_storage(str(tmp_path), **dummy_kwargs)
 
-        mock_file2 = MagicMock(spec=Path)
-        mock_file2.is_file.return_value = True
-        mock_file2.__str__.return_value = "/project_dir/target/file2.txt"
+    s3_remote_target_dir.fs._put_file.assert_not_awaited()
 
-        mock_rglob.return_value = [mock_file1, mock_file2]
 
-        upload_to_cloud_storage("/project_dir", **dummy_kwargs)
+@pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
+def test_upload_artifacts_to_cloud_storage_bundle(dummy_kwargs, project_dir, monkeypatch):
+    """Test upload_artifacts_to_cloud_storage uploads a single archive when bundle is enabled."""
+    from airflow.io.path import ObjectStoragePath
+
+    monkeypatch.setenv("AIRFLOW_CONN_AWS_DEFAULT", "aws://")
+    dest_target_dir = ObjectStoragePath("s3://bucket/dest", conn_id="aws_default")
+    # The synchronous put_file is bound to the original _put_file when the file system is created, so it is patched
+    with patch("cosmos.io._configure_remote_target_path", return_value=(dest_target_dir, "aws_default")), patch.object(
+        dest_target_dir.fs, "put_file"
+    ) as mock_put_file:
+        upload_to_cloud_storage(str(project_dir), bundle=True, **dummy_kwargs)
 
-        mock_configure.assert_called_once()
-        assert mock_copy.call_count == 2
+    mock_put_file.assert_called_once()
+    bundle_path, dest_bundle_path = mock_put_file.call_args.args
+    assert bundle_path.endswith("target.tar.gz")
+    assert dest_bundle_path == "bucket/dest/test_dag/test_run_id/test_task/1/target.tar.gz"
 
 
 @pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
@@ -136,6 +568,23 @@ def test_configure_remote_target_path_no_conn_id(mock_urlparse, mock_object_stor
     assert result == (mock_object_storage.return_value, _default_s3_conn)
 
 
+@pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
+@patch("cosmos.io.settings.remote_target_path", "s3://bucket/path/to/file")
+@patch("cosmos.io.settings.remote_target_path_conn_id", "aws_conn")
+@patch("airflow.io.path.ObjectStoragePath")
+def test_configure_remote_target_path_checks_existence_once(mock_object_storage):
+    """Test the existence of the remote target path is only checked the first time it is configured."""
+    mock_storage_path = MagicMock()
+    mock_storage_path.exists.return_value = False
+    mock_object_storage.return_value = mock_storage_path
+
+    assert _configure_remote_target_path() == (mock_storage_path, "aws_conn")
+    assert _configure_remote_target_path() == (mock_storage_path, "aws_conn")
+
+    mock_storage_path.exists.assert_called_once()
+    mock_storage_path.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+
 @pytest.mark.skipif(not AIRFLOW_IO_AVAILABLE, reason="Airflow did not have Object Storage until the 2.8 release")
 @patch("cosmos.io.settings.remote_target_path", "abcd://bucket/path/to/file")
 @patch("cosmos.io.settings.remote_target_path_conn_id", None)
@@ -4,7 +4,10 @@ import textwrap
 from importlib import reload
 from unittest.mock import patch
 
+import pytest
+
 from cosmos import settings
+from cosmos.exceptions import CosmosValueError
 
 
 @patch.dict(os.environ, {"AIRFLOW__COSMOS__ENABLE_CACHE": "False"}, clear=True)
@@ -13,31 +16,35 @@ def test_enable_cache_env_var():
     assert settings.enable_cache is False
 
 
+def test_upload_concurrency_must_be_positive():
+    with patch.dict(os.environ, {"AIRFLOW__COSMOS__UPLOAD_CONCURRENCY": "0"}), pytest.raises(
+        CosmosValueError, match="upload_concurrency setting must be greater than or equal to 1, got 0"
+    ):
+        reload(settings)
+    reload(settings)
+
+
 def test_enable_memory_optimised_imports_true(monkeypatch):
-    script = textwrap.dedent(
-        """
+    script = textwrap.dedent("""
             import os
             os.environ["AIRFLOW__COSMOS__ENABLE_MEMORY_OPTIMISED_IMPORTS"] = "True"
             import cosmos
             assert cosmos.settings.enable_memory_optimised_imports is True
             assert not hasattr(cosmos, "DbtDag")
-        """
-    )
+        """)
 
     result = subprocess.run(["python", "-c", script], capture_output=True, text=True)
     assert result.returncode == 0, result.stderr
 
 
 def test_enable_memory_optimised_imports_false(monkeypatch):
-    script = textwrap.dedent(
-        """
+    script = textwrap.dedent("""
             import os
             os.environ["AIRFLOW__COSMOS__ENABLE_MEMORY_OPTIMISED_IMPORTS"] = "False"
             import cosmos
             assert cosmos.settings.enable_memory_optimised_imports is False
             assert hasattr(cosmos, "DbtDag")
-        """
-    )
+        """)
 
     result = subprocess.run(["python", "-c", script], capture_output=True, text=True)
     assert result.returncode == 0, result.stderr